@@ -0,0 +1,132 @@
+"""
+Startup benchmark for the diabetes dashboard
+
+Runs app.py headlessly on the Introduction page in a fresh interpreter under
+``-X importtime`` and reports the time to first paint together with the
+slowest imports, so regressions in eager imports show up immediately.
+
+Usage:
+    python benchmarks/startup.py [--page "📚 Introduction"] [--top 15] [--strict]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "app.py"
+
+# Time-to-first-paint budget for the Introduction page, in seconds, measured
+# from importing Streamlit to the end of the first script run
+TTFP_TARGET_S = 1.5
+
+# Modules that no metric-only page should have to import. Streamlit itself
+# imports plotly and plotly.graph_objects for its chart theme, so only the
+# figure-building modules tell a regression apart from normal startup.
+HEAVY_MODULES = ("plotly.express", "utils.figures", "matplotlib", "seaborn", "sklearn")
+
+# The Introduction page has painted once its Quick Overview metrics are shown
+INTRO_METRICS = 3
+
+
+def _run_app(page: Optional[str]) -> None:
+    """Child process: render one page through Streamlit's app test harness"""
+    sys.path.insert(0, str(ROOT))
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(APP), default_timeout=60)
+    app.run()
+    if page and app.sidebar.radio[0].value != page:
+        app.sidebar.radio[0].set_value(page).run()
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps({
+        "first_paint_s": elapsed,
+        "exceptions": [str(e.value) for e in app.exception],
+        "errors": [str(e.value) for e in app.error],
+        "metrics": len(app.metric),
+        "heavy_modules": sorted(m for m in HEAVY_MODULES if m in sys.modules)
+    }))
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Map each imported module to its (self, cumulative) import time in microseconds"""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def top_level(times: Dict[str, Tuple[int, int]], top: int) -> List[Tuple[str, int]]:
+    """Slowest top-level packages by cumulative import time"""
+    packages = {}
+    for name, (_, cumulative_us) in times.items():
+        if "." not in name:
+            packages[name] = max(packages.get(name, 0), cumulative_us)
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page", default=None, help="page to render (default: Introduction)")
+    parser.add_argument("--top", type=int, default=15, help="number of imports to list")
+    parser.add_argument("--strict", action="store_true", help="exit non-zero when over target")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _run_app(args.page)
+        return 0
+
+    command = [sys.executable, "-X", "importtime", __file__, "--child"]
+    if args.page:
+        command += ["--page", args.page]
+
+    started = time.perf_counter()
+    proc = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-4000:])
+        return proc.returncode
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    times = parse_importtime(proc.stderr)
+    total_import_us = sum(self_us for self_us, _ in times.values())
+    first_paint = result["first_paint_s"]
+    # An error page (e.g. no CSV under data/) stops early and would look fast
+    problems = result["exceptions"] + result["errors"]
+    if not args.page and result["metrics"] < INTRO_METRICS:
+        problems.append(f"expected {INTRO_METRICS} Quick Overview metrics, found {result['metrics']}")
+
+    print(f"Page:                 {args.page or 'default (Introduction)'}")
+    print(f"Process wall time:    {wall:.2f}s")
+    if problems:
+        print("Time to first paint:  not reached, the page did not render")
+    else:
+        print(f"Time to first paint:  {first_paint:.2f}s (target {TTFP_TARGET_S:.2f}s)")
+    print(f"Total import time:    {total_import_us / 1e6:.2f}s over {len(times)} modules")
+    print(f"Heavy modules loaded: {', '.join(result['heavy_modules']) or 'none'}")
+    for problem in problems:
+        print(f"App problem:          {problem}")
+    print()
+    print(f"{'cumulative [ms]':>16}  package")
+    for name, cumulative_us in top_level(times, args.top):
+        print(f"{cumulative_us / 1000:>16.1f}  {name}")
+
+    if problems:
+        return 2
+    if args.strict and first_paint > TTFP_TARGET_S:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from utils import dataset_registry
+from utils.dataset_registry import DatasetRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = DatasetRegistry(tmp_path)
+    yield registry
+    registry.close()
+
+
+def test_touched_file_keeps_its_key(tmp_path, registry):
+    source = tmp_path / "data.csv"
+    source.write_text("BMI\n30\n")
+    before = registry.current("data.csv")
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    after = registry.current("data.csv")
+
+    assert after.key == before.key
+    assert after.path.read_text() == "BMI\n30\n"
+
+
+def test_replaced_file_gets_a_new_key_and_snapshot(tmp_path, registry):
+    source = tmp_path / "data.csv"
+    source.write_text("BMI\n30\n")
+    before = registry.current("data.csv")
+
+    source.write_text("BMI\n30\n41\n")
+    after = registry.current("data.csv")
+
+    assert after.key != before.key
+    assert after.path != before.path
+    assert after.path.read_text() == "BMI\n30\n41\n"
+    assert before.path.read_text() == "BMI\n30\n"
+
+
+def test_file_caught_mid_write_keeps_the_old_version(tmp_path, registry, monkeypatch):
+    source = tmp_path / "data.csv"
+    source.write_text("BMI\n30\n")
+    before = registry.current("data.csv")
+
+    snapshot = dataset_registry._snapshot
+
+    def write_during_read(path, snapshot_dir):
+        sha256 = snapshot(path, snapshot_dir)
+        with open(path, "a") as handle:
+            handle.write("41\n")
+        return sha256
+
+    source.write_text("BMI\n30\n35\n")
+    monkeypatch.setattr(dataset_registry, "_snapshot", write_during_read)
+    assert registry.current("data.csv") == before
+    assert sorted(registry.snapshot_dir.iterdir()) == [before.path]
+
+    monkeypatch.undo()
+    assert registry.current("data.csv").path.read_text() == "BMI\n30\n35\n41\n"
+
+
+def test_only_requested_files_are_snapshotted(tmp_path, registry):
+    (tmp_path / "data.csv").write_text("BMI\n30\n")
+    (tmp_path / "other.csv").write_text("BMI\n25\n")
+
+    registry.current("data.csv")
+
+    assert [path.name.split("-", 1)[1] for path in registry.snapshot_dir.iterdir()] == ["data.csv"]
+    assert registry.current("missing.csv") is None
+
+
+def test_close_removes_the_snapshots(tmp_path):
+    (tmp_path / "data.csv").write_text("BMI\n30\n")
+    registry = DatasetRegistry(tmp_path)
+    registry.current("data.csv")
+
+    registry.close()
+
+    assert not registry.snapshot_dir.exists()
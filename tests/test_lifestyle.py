@@ -0,0 +1,59 @@
+import io
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+from utils.lifestyle import MAX_SCORE, risk_level, risk_tier, score_cohort_csv, score_lifestyle
+
+
+def test_worst_self_assessment_is_full_risk():
+    score = score_lifestyle("None", "Rarely", "Current", "Heavy")
+
+    assert score == MAX_SCORE
+    assert risk_level(score) == 1.0
+    assert risk_tier(score) == "High"
+
+
+@pytest.mark.parametrize("score, tier", [(1, "Low"), (2, "Moderate"), (3, "Moderate"), (4, "High")])
+def test_tier_cutoffs_are_in_points(score, tier):
+    assert risk_tier(score) == tier
+
+
+def test_self_assessment_and_cohort_agree_on_tier():
+    score = score_lifestyle("None", "Rarely", "Non-smoker", "None")
+    source = io.StringIO("PhysActivity,Veggies,Smoker,HvyAlcoholConsump\n0,0,0,0\n")
+    out = io.StringIO()
+
+    score_cohort_csv(source, out)
+
+    assert (score, risk_tier(score)) == (4, "High")
+    assert out.getvalue().splitlines()[1] == "0,0,0,0,4,High"
+
+
+def test_all_risk_row_scores_max_and_high_tier():
+    source = io.StringIO("PhysActivity,Veggies,Smoker,HvyAlcoholConsump\n0,0,1,1\n")
+    out = io.StringIO()
+
+    summary = score_cohort_csv(source, out)
+
+    assert MAX_SCORE == 7
+    assert summary.score_counts[MAX_SCORE] == 1
+    assert summary.tier_counts["High"] == 1
+    assert out.getvalue().splitlines()[1] == "0,0,1,1,7,High"
+
+
+def test_scored_output_keeps_identifiers_and_drops_other_measures():
+    source = io.StringIO(
+        "patient_id,BMI,PhysActivity,Veggies,Smoker,HvyAlcoholConsump\n"
+        "007,31.0,1,1,0,0\n"
+    )
+    out = io.StringIO()
+
+    score_cohort_csv(source, out)
+
+    assert out.getvalue().splitlines() == [
+        "patient_id,PhysActivity,Veggies,Smoker,HvyAlcoholConsump,Lifestyle_Score,Risk_Tier",
+        "007,1,1,0,0,0,Low"
+    ]
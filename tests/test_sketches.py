@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from utils.sketches import QuantileSketch, SketchCube
+
+QUARTILES = [0.25, 0.5, 0.75]
+DIMENSIONS = ("Diabetes_012", "Sex")
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "Diabetes_012": [0, 0, 0, 0, 1, 1, 2, 2, 2, np.nan],
+        "Sex": [0, 1, 1, 0, 1, 0, 0, 1, 1, 1],
+        "BMI": [22, 27, np.nan, 31, 35, 24, 40, np.nan, 29, 50]
+    })
+
+
+@pytest.fixture
+def cube(df):
+    return SketchCube(df, measures={"BMI": (10, 100, 1)}, dimensions=DIMENSIONS)
+
+
+def test_sketch_matches_pandas_quantile(df, cube):
+    expected = df.dropna(subset=list(DIMENSIONS))["BMI"].quantile(QUARTILES).to_numpy()
+
+    assert np.allclose(cube.sketch("BMI").quantile(QUARTILES), expected)
+    assert cube.missing["BMI"] == 2
+
+
+def test_filtered_sketch_matches_pandas_quantile(df, cube):
+    rows = df[df["Sex"] == 1].dropna(subset=list(DIMENSIONS))
+
+    assert cube.sketch("BMI", Sex=1).median() == rows["BMI"].median()
+
+
+def test_by_matches_pandas_groupby(df, cube):
+    expected = df.groupby("Diabetes_012")["BMI"].quantile(QUARTILES).unstack()
+
+    by_status = cube.by("BMI", "Diabetes_012")
+
+    assert sorted(by_status) == [0, 1, 2]
+    for status, sketch in by_status.items():
+        assert sketch.count == df.loc[df["Diabetes_012"] == status, "BMI"].count()
+        assert np.allclose(sketch.quantile(QUARTILES), expected.loc[status].to_numpy())
+
+
+def test_box_stats_whiskers_stop_at_observed_values_inside_fences():
+    sketch = QuantileSketch.from_values([12, 20, 21, 22, 23, 24, 25, 60, np.nan], 10, 100)
+
+    stats = sketch.box_stats()
+
+    # q1 = 20.75 and q3 = 24.25, so the Tukey fences are 15.5 and 29.5
+    assert (stats["q1"], stats["median"], stats["q3"]) == (20.75, 22.5, 24.25)
+    assert (stats["lowerfence"], stats["upperfence"]) == (20, 25)
+    assert (stats["min"], stats["max"]) == (12, 60)
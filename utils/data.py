@@ -0,0 +1,60 @@
+"""
+Dataset loading and storytelling columns for the diabetes dashboard
+"""
+
+from pathlib import Path
+from typing import Union
+import pandas as pd
+
+from utils.story_content import DIABETES_STORIES
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DATA_FILE = DATA_DIR / "diabetes_012_health_indicators_BRFSS2015.csv"
+
+BRFSS_COLUMNS = (
+    "Diabetes_012", "HighBP", "HighChol", "CholCheck", "BMI", "Smoker", "Stroke",
+    "HeartDiseaseorAttack", "PhysActivity", "Fruits", "Veggies", "HvyAlcoholConsump",
+    "AnyHealthcare", "NoDocbcCost", "GenHlth", "MentHlth", "PhysHlth", "DiffWalk",
+    "Sex", "Age", "Education", "Income"
+)
+
+
+def get_age_group(age: int) -> str:
+    if age <= 4:
+        return 'Youth (18-24)'
+    elif age <= 6:
+        return 'Young Adult (25-34)'
+    elif age <= 8:
+        return 'Midlife (35-44)'
+    elif age <= 10:
+        return 'Established (45-54)'
+    elif age <= 12:
+        return 'Mature (55-64)'
+    else:
+        return 'Senior (65+)'
+
+
+def get_bmi_category(bmi: float) -> str:
+    if bmi < 18.5:
+        return 'Underweight'
+    elif bmi < 25:
+        return 'Healthy weight'
+    elif bmi < 30:
+        return 'Overweight'
+    elif bmi < 40:
+        return 'Obese'
+    else:
+        return 'Severely obese'
+
+
+def add_story_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the narrative label columns used across the chapters"""
+    df['Diabetes_Story'] = df['Diabetes_012'].map(DIABETES_STORIES)
+    df['Age_Group'] = df['Age'].apply(get_age_group)
+    df['BMI_Category'] = df['BMI'].apply(get_bmi_category)
+    return df
+
+
+def read_dataset(path: Union[str, Path] = DATA_FILE) -> pd.DataFrame:
+    """Read the BRFSS CSV and derive the storytelling columns"""
+    return add_story_columns(pd.read_csv(path))
@@ -0,0 +1,127 @@
+"""
+Dataset registry for the diabetes dashboard
+
+Fingerprints the source files under ``data/`` that the app asks for, so it
+notices new or replaced CSVs without a restart. Cheap ``stat`` metadata is checked on every
+lookup and the content is only re-hashed when it changed, so touching a file
+without editing it keeps the same version and every warm cache.
+
+Each new version is copied to a private snapshot while it is hashed, and
+readers parse that snapshot, so the bytes behind a version key never change
+even if the source file is replaced again mid-read. Snapshots live in a
+temporary directory that is removed when the registry is closed or the
+process exits. Only the latest few snapshots are kept, so a reader holding an
+older version should catch ``FileNotFoundError`` and ask for the current one.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CHUNK_SIZE = 1 << 20
+
+# Snapshots kept per dataset: the current one plus the one sessions may still
+# be reading while they switch over
+KEEP_SNAPSHOTS = 2
+
+
+@dataclass(frozen=True)
+class DatasetVersion:
+    """An immutable snapshot of one source file"""
+
+    name: str
+    # Immutable snapshot to read from; ``source`` is the watched file
+    path: Path
+    source: Path
+    mtime_ns: int
+    size: int
+    sha256: str
+
+    @property
+    def key(self) -> str:
+        """Cache key for everything derived from this version"""
+        return f"{self.name}@{self.sha256[:16]}"
+
+
+def _snapshot(path: Path, snapshot_dir: Path) -> str:
+    """Copy ``path`` into ``snapshot_dir`` while hashing the same bytes"""
+    digest = hashlib.sha256()
+    handle, tmp = tempfile.mkstemp(dir=snapshot_dir, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as target, open(path, "rb") as source:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                target.write(chunk)
+        sha256 = digest.hexdigest()
+        os.replace(tmp, snapshot_dir / f"{sha256[:16]}-{path.name}")
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return sha256
+
+
+class DatasetRegistry:
+    """Track the current version of every dataset file in a directory"""
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        # Removed by close(), or by its finalizer when the process exits
+        self._tmp = tempfile.TemporaryDirectory(prefix="dataset-registry-")
+        self.snapshot_dir = Path(self._tmp.name)
+        self._versions: Dict[str, DatasetVersion] = {}
+        self._snapshots: Dict[str, List[Path]] = {}
+        self._lock = threading.Lock()
+
+    def current(self, name: str) -> Optional[DatasetVersion]:
+        """Current version of one dataset, or None when it does not exist"""
+        with self._lock:
+            version = self._fingerprint(self.data_dir / name, self._versions.get(name))
+            if version is None:
+                self._versions.pop(name, None)
+            else:
+                self._versions[name] = version
+            return version
+
+    def close(self) -> None:
+        """Delete every snapshot"""
+        with self._lock:
+            self._versions.clear()
+            self._snapshots.clear()
+            self._tmp.cleanup()
+
+    def _fingerprint(self, path: Path, known: Optional[DatasetVersion]) -> Optional[DatasetVersion]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        if (known is not None and (known.mtime_ns, known.size) == (stat.st_mtime_ns, stat.st_size)
+                and known.path.exists()):
+            return known
+
+        sha256 = _snapshot(path, self.snapshot_dir)
+        snapshot = self.snapshot_dir / f"{sha256[:16]}-{path.name}"
+        after = path.stat()
+        if (after.st_mtime_ns, after.st_size) != (stat.st_mtime_ns, stat.st_size):
+            # Still being written; keep serving the previous snapshot
+            if snapshot not in self._snapshots.get(path.name, []):
+                snapshot.unlink(missing_ok=True)
+            return known
+
+        self._keep_snapshot(path.name, snapshot)
+        # The cache key only depends on the content hash, so a touched but
+        # unedited file keeps its derived caches
+        return DatasetVersion(path.name, snapshot, path, stat.st_mtime_ns, stat.st_size, sha256)
+
+    def _keep_snapshot(self, name: str, snapshot: Path) -> None:
+        snapshots = self._snapshots.setdefault(name, [])
+        if snapshot in snapshots:
+            snapshots.remove(snapshot)
+        snapshots.append(snapshot)
+        for stale in snapshots[:-KEEP_SNAPSHOTS]:
+            stale.unlink(missing_ok=True)
+        del snapshots[:-KEEP_SNAPSHOTS]
@@ -0,0 +1,256 @@
+"""
+Chapter aggregates and Plotly figures for the diabetes dashboard
+
+Every figure is built from pre-aggregated values rather than raw rows, so the
+same objects can be rendered by Streamlit or serialized into the static export.
+"""
+
+from typing import Dict
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from utils.data import get_age_group
+from utils.lifestyle import MAX_SCORE, RISK_TIERS, CohortSummary
+from utils.sketches import QuantileSketch, SketchCube
+from utils.story_content import DIABETES_STORIES, STORY_COLORS
+
+LIFESTYLE_FACTORS = {
+    'PhysActivity': 'Physical Activity',
+    'Fruits': 'Fruit Consumption',
+    'Veggies': 'Vegetable Consumption',
+    'Smoker': 'Smoking',
+    'HvyAlcoholConsump': 'Heavy Alcohol'
+}
+
+
+def similar_profiles_pie(df: pd.DataFrame):
+    """Outcomes of people resembling Maria, or None when nobody matches"""
+    similar_profiles = df[
+        (df['BMI'].between(29, 33)) &
+        (df['Age'].between(4, 8))  # Age codes 4-8 correspond to 35-54
+    ]
+    if len(similar_profiles) == 0:
+        return None
+
+    diabetes_counts = similar_profiles['Diabetes_Story'].value_counts()
+
+    # Ensure all categories are represented
+    values = []
+    labels = []
+    for category in DIABETES_STORIES.values():
+        if category in diabetes_counts.index:
+            values.append(diabetes_counts[category])
+            labels.append(category)
+
+    if not values:
+        return None
+
+    return px.pie(
+        values=values,
+        names=labels,
+        title="Health Outcomes of Similar People",
+        color_discrete_sequence=STORY_COLORS
+    )
+
+
+def prevalence_pie(df: pd.DataFrame):
+    diabetes_counts = df['Diabetes_Story'].value_counts()
+    return px.pie(
+        values=diabetes_counts.values,
+        names=diabetes_counts.index,
+        title="The Three Paths: Population Distribution",
+        hole=0.4,
+        color_discrete_sequence=STORY_COLORS
+    )
+
+
+def age_prevalence_bar(df: pd.DataFrame):
+    age_diabetes = df.groupby('Age_Group')['Diabetes_012'].mean() * 100
+    return px.bar(
+        x=age_diabetes.index,
+        y=age_diabetes.values,
+        title="Diabetes Prevalence by Age Group",
+        labels={'x': 'Age Group', 'y': 'Diabetes Rate (%)'},
+        color=age_diabetes.values,
+        color_continuous_scale='Viridis'
+    )
+
+
+def bmi_histogram(df: pd.DataFrame, nbins: int = 30):
+    """BMI distribution by diabetes status, binned before plotting"""
+    # Blank BMI cells are left out, as px.histogram did
+    bmi = df['BMI'].dropna()
+    status_of = df.loc[bmi.index, 'Diabetes_Story']
+    edges = np.histogram_bin_edges(bmi, bins=nbins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    fig = go.Figure()
+    for status, color in zip(DIABETES_STORIES.values(), STORY_COLORS):
+        counts, _ = np.histogram(bmi[status_of == status], bins=edges)
+        fig.add_bar(x=centers, y=counts, width=np.diff(edges), name=status,
+                    marker_color=color, opacity=0.7)
+    fig.update_layout(
+        barmode='overlay',
+        title="BMI Distribution by Diabetes Status",
+        xaxis_title="BMI", yaxis_title="count",
+        legend_title_text="Diabetes_Story"
+    )
+    return fig
+
+
+def _box_trace(sketches: Dict[str, QuantileSketch], name: str, color: str) -> go.Box:
+    """Box trace drawn from sketch quartiles instead of raw rows"""
+    labels = [label for label, sketch in sketches.items() if sketch.count]
+    stats = [sketches[label].box_stats() for label in labels]
+    return go.Box(
+        x=labels, name=name, marker_color=color,
+        **{key: [s[key] for s in stats] for key in ("q1", "median", "q3", "lowerfence", "upperfence")}
+    )
+
+
+def bmi_box_by_status(cube: SketchCube):
+    by_status = cube.by("BMI", "Diabetes_012")
+    sketches = {DIABETES_STORIES[status]: sketch for status, sketch in by_status.items()}
+    fig = go.Figure()
+    for (label, sketch), color in zip(sketches.items(), STORY_COLORS):
+        fig.add_trace(_box_trace({label: sketch}, label, color))
+    fig.update_layout(title="BMI Spread by Diabetes Status", yaxis_title="BMI", showlegend=False)
+    return fig
+
+
+def bmi_box_by_age_group(cube: SketchCube):
+    sketches = {}
+    for age, sketch in cube.by("BMI", "Age").items():
+        group = get_age_group(age)
+        sketches[group] = sketches[group].merge(sketch) if group in sketches else sketch
+    fig = go.Figure(_box_trace(sketches, "BMI", STORY_COLORS[0]))
+    fig.update_layout(title="BMI Through Life Stages", xaxis_title="Age Group",
+                      yaxis_title="BMI", showlegend=False)
+    return fig
+
+
+def health_days_box(cube: SketchCube):
+    """Unhealthy mental and physical days in the past month by diabetes status"""
+    fig = go.Figure()
+    for measure, name, color in (("MentHlth", "Mental health", STORY_COLORS[0]),
+                                 ("PhysHlth", "Physical health", STORY_COLORS[2])):
+        sketches = {DIABETES_STORIES[status]: sketch
+                    for status, sketch in cube.by(measure, "Diabetes_012").items()}
+        fig.add_trace(_box_trace(sketches, name, color))
+    fig.update_layout(boxmode="group", title="Unhealthy Days in the Past Month",
+                      xaxis_title="Diabetes Status", yaxis_title="Days")
+    return fig
+
+
+def comorbidity_bar(df: pd.DataFrame, risk_factor: str, column: str):
+    comorbidity = df.groupby('Diabetes_Story')[column].mean() * 100
+    return px.bar(
+        x=comorbidity.index,
+        y=comorbidity.values,
+        title=f"{risk_factor} by Diabetes Status",
+        labels={'x': 'Diabetes Status', 'y': f'{risk_factor} Rate (%)'},
+        color=comorbidity.index,
+        color_discrete_sequence=STORY_COLORS
+    )
+
+
+def income_bar(df: pd.DataFrame):
+    income_groups = pd.cut(df['Income'], bins=[0, 4, 6, 8, 10],
+                           labels=['Low', 'Medium', 'High', 'Very High'])
+
+    income_diabetes = pd.DataFrame({
+        'Income_Level': income_groups,
+        'Diabetes': df['Diabetes_012'] == 2
+    }).groupby('Income_Level', observed=False)['Diabetes'].mean() * 100
+
+    return px.bar(
+        x=income_diabetes.index,
+        y=income_diabetes.values,
+        title="Diabetes Rates by Income Level",
+        labels={'x': 'Income Level', 'y': 'Diabetes Rate (%)'},
+        color=income_diabetes.values,
+        color_continuous_scale='Viridis'
+    )
+
+
+def education_line(df: pd.DataFrame):
+    education_diabetes = df.groupby('Education')['Diabetes_012'].apply(
+        lambda x: (x == 2).mean() * 100
+    ).reset_index()
+
+    fig = px.line(
+        education_diabetes,
+        x='Education',
+        y='Diabetes_012',
+        title="Education and Diabetes Risk",
+        markers=True
+    )
+    fig.update_layout(xaxis_title="Education Level (1=Lowest, 6=Highest)",
+                      yaxis_title="Diabetes Rate (%)")
+    return fig
+
+
+def lifestyle_bar(df: pd.DataFrame):
+    lifestyle_data = []
+    for factor, name in LIFESTYLE_FACTORS.items():
+        lifestyle_data.append({
+            'Factor': name,
+            'Healthy': df[df['Diabetes_012'] == 0][factor].mean() * 100,
+            'Diabetic': df[df['Diabetes_012'] == 2][factor].mean() * 100
+        })
+
+    return px.bar(
+        pd.DataFrame(lifestyle_data),
+        x='Factor',
+        y=['Healthy', 'Diabetic'],
+        barmode='group',
+        title="Lifestyle Factors: Healthy vs Diabetic Populations",
+        labels={'value': 'Percentage (%)', 'variable': 'Group'},
+        color_discrete_sequence=['#2E86AB', '#A23B72']
+    )
+
+
+TIER_COLORS = {"Low": '#2E86AB', "Moderate": '#F18F01', "High": '#A23B72'}
+
+
+def cohort_tier_bar(summary: CohortSummary):
+    return px.bar(
+        x=list(summary.tier_counts),
+        y=list(summary.tier_counts.values()),
+        title="Cohort Lifestyle Risk Tiers",
+        labels={'x': 'Risk Tier', 'y': 'Patients'},
+        color=list(summary.tier_counts),
+        color_discrete_map=TIER_COLORS
+    )
+
+
+def cohort_score_bar(summary: CohortSummary):
+    return px.bar(
+        x=list(range(MAX_SCORE + 1)),
+        y=summary.score_counts,
+        title="Cohort Lifestyle Score Distribution",
+        labels={'x': f'Lifestyle Score (0-{MAX_SCORE})', 'y': 'Patients'},
+        color_discrete_sequence=STORY_COLORS
+    )
+
+
+def cohort_tier_by_status(summary: CohortSummary):
+    """Tier mix within each recorded diabetes status, or None without Diabetes_012"""
+    if not summary.tier_by_status:
+        return None
+    rows = [
+        {'Status': DIABETES_STORIES[status], 'Tier': tier, 'Share': count / max(sum(tiers.values()), 1) * 100}
+        for status, tiers in sorted(summary.tier_by_status.items())
+        for tier, count in tiers.items()
+    ]
+    return px.bar(
+        pd.DataFrame(rows),
+        x='Status',
+        y='Share',
+        color='Tier',
+        category_orders={'Tier': list(RISK_TIERS)},
+        color_discrete_map=TIER_COLORS,
+        title="Lifestyle Risk Tiers by Diabetes Status",
+        labels={'Share': 'Share of Patients (%)', 'Status': 'Diabetes Status'}
+    )
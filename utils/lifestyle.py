@@ -0,0 +1,179 @@
+"""
+Lifestyle risk scoring for individuals and uploaded cohorts
+
+The single-person assessment and the batch path share one points table and
+one set of tier cut-offs. A
+cohort CSV uses the BRFSS indicator columns, is read in chunks so memory stays
+bounded, and every chunk is validated and scored with array lookups. The
+scored file keeps the clinic's own columns (identifiers and the like) as text
+plus the indicators, score and tier; the other BRFSS measures are not echoed.
+"""
+
+from dataclasses import dataclass, field
+from typing import IO, Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from utils.data import BRFSS_COLUMNS
+
+EXERCISE_SCORES = {"None": 2, "1-2 days": 1, "3-4 days": 0, "5+ days": 0}
+VEGGIE_SCORES = {"Rarely": 2, "1-2": 1, "3-4": 0, "5+": 0}
+SMOKING_SCORES = {"Non-smoker": 0, "Former": 1, "Current": 2}
+ALCOHOL_SCORES = {"None": 0, "Moderate": 0, "Heavy": 1}
+MAX_SCORE = sum(max(scores.values()) for scores in
+                (EXERCISE_SCORES, VEGGIE_SCORES, SMOKING_SCORES, ALCOHOL_SCORES))
+
+RISK_TIERS = ("Low", "Moderate", "High")
+
+# Lowest score of each tier, highest tier first. These are the original
+# cut-offs of the personal assessment, expressed in points.
+TIER_CUTOFFS = (("High", 4), ("Moderate", 2), ("Low", 0))
+
+# The assessment's progress bar has always filled at 6 points; the all-risk
+# answer (7 points) is capped at a full bar
+ASSESSMENT_SCALE = 6
+
+# BRFSS indicator -> points for a recorded 0 and 1. Smoker only records 100+
+# lifetime cigarettes, so it cannot tell former from current smokers and is
+# scored like a current smoker.
+INDICATOR_POINTS: Dict[str, Tuple[int, int]] = {
+    "PhysActivity": (EXERCISE_SCORES["None"], EXERCISE_SCORES["5+ days"]),
+    "Veggies": (VEGGIE_SCORES["Rarely"], VEGGIE_SCORES["5+"]),
+    "Smoker": (SMOKING_SCORES["Non-smoker"], SMOKING_SCORES["Current"]),
+    "HvyAlcoholConsump": (ALCOHOL_SCORES["None"], ALCOHOL_SCORES["Heavy"])
+}
+
+CHUNK_SIZE = 250_000
+
+
+def risk_tier(score: int) -> str:
+    for tier, lowest in TIER_CUTOFFS:
+        if score >= lowest:
+            return tier
+    return RISK_TIERS[0]
+
+
+# Scores are small integers, so the tier of every possible score is precomputed
+TIER_BY_SCORE = np.array([RISK_TIERS.index(risk_tier(s)) for s in range(MAX_SCORE + 1)], dtype=np.int8)
+_POINTS = {column: np.array(points, dtype=np.int8) for column, points in INDICATOR_POINTS.items()}
+
+
+def score_lifestyle(weekly_exercise: str, daily_veggies: str,
+                    smoking_status: str, alcohol_consumption: str) -> int:
+    """Lifestyle score in points for one self-assessment"""
+    return (EXERCISE_SCORES[weekly_exercise] + VEGGIE_SCORES[daily_veggies] +
+            SMOKING_SCORES[smoking_status] + ALCOHOL_SCORES[alcohol_consumption])
+
+
+def risk_level(score: int) -> float:
+    """Progress-bar fill between 0 and 1 for a score"""
+    return min(score / ASSESSMENT_SCALE, 1.0)
+
+
+class CohortValidationError(ValueError):
+    """Raised when an uploaded cohort does not match the BRFSS indicator schema"""
+
+
+def validate_indicators(chunk: pd.DataFrame, first_row: int = 0) -> Dict[str, np.ndarray]:
+    """Return the indicator columns as int8 arrays, or raise on bad values"""
+    missing = [column for column in INDICATOR_POINTS if column not in chunk.columns]
+    if missing:
+        raise CohortValidationError(f"Missing required columns: {', '.join(missing)}")
+
+    columns = {}
+    problems = []
+    for column in INDICATOR_POINTS:
+        values = pd.to_numeric(chunk[column], errors="coerce").to_numpy(dtype=float)
+        bad = np.flatnonzero((values != 0) & (values != 1))
+        if len(bad):
+            # +2 for the header line and one-based row numbers
+            rows = ", ".join(str(first_row + i + 2) for i in bad[:5])
+            more = f" and {len(bad) - 5} more" if len(bad) > 5 else ""
+            problems.append(f"{column} must be 0 or 1 (CSV lines {rows}{more})")
+        else:
+            columns[column] = values.astype(np.int8)
+    if problems:
+        raise CohortValidationError("; ".join(problems))
+    return columns
+
+
+def score_indicators(columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Lifestyle score and tier code for every row"""
+    score = sum(_POINTS[column][values] for column, values in columns.items())
+    return score, TIER_BY_SCORE[score]
+
+
+@dataclass
+class CohortSummary:
+    """Cohort-level counts accumulated while scoring"""
+
+    rows: int = 0
+    score_counts: List[int] = field(default_factory=lambda: [0] * (MAX_SCORE + 1))
+    tier_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(RISK_TIERS, 0))
+    # diabetes status -> tier -> count, when the upload has Diabetes_012;
+    # rows with a missing or unknown status are left out
+    tier_by_status: Optional[Dict[int, Dict[str, int]]] = None
+
+    def add(self, scores: np.ndarray, tiers: np.ndarray, status: Optional[np.ndarray]) -> None:
+        """Fold one scored chunk into the totals (status -1 means unknown)"""
+        self.rows += len(scores)
+        for score, count in enumerate(np.bincount(scores, minlength=MAX_SCORE + 1)):
+            self.score_counts[score] += int(count)
+        for code, count in enumerate(np.bincount(tiers, minlength=len(RISK_TIERS))):
+            self.tier_counts[RISK_TIERS[code]] += int(count)
+        if status is None:
+            return
+        if self.tier_by_status is None:
+            self.tier_by_status = {}
+        for value in np.unique(status[status >= 0]):
+            counts = np.bincount(tiers[status == value], minlength=len(RISK_TIERS))
+            row = self.tier_by_status.setdefault(int(value), dict.fromkeys(RISK_TIERS, 0))
+            for code, count in enumerate(counts):
+                row[RISK_TIERS[code]] += int(count)
+
+
+def _read_header(source: Union[str, IO]) -> List[str]:
+    """Column names of a CSV path or buffer, leaving a buffer where it was"""
+    position = source.tell() if hasattr(source, "seek") else None
+    columns = list(pd.read_csv(source, nrows=0).columns)
+    if position is not None:
+        source.seek(position)
+    return columns
+
+
+def score_cohort_csv(source: Union[str, IO], out: IO[str],
+                     chunksize: int = CHUNK_SIZE) -> CohortSummary:
+    """Score a cohort CSV chunk by chunk, writing the scored rows to the text stream ``out``
+
+    Non-BRFSS columns are passed through as text, followed by the indicator
+    columns, ``Lifestyle_Score`` and ``Risk_Tier``.
+    """
+    header = _read_header(source)
+    passthrough = [column for column in header if column not in BRFSS_COLUMNS]
+    wanted = set(passthrough) | set(INDICATOR_POINTS)
+    if "Diabetes_012" in header:
+        wanted.add("Diabetes_012")
+
+    summary = CohortSummary()
+    reader = pd.read_csv(source, chunksize=chunksize, usecols=lambda column: column in wanted,
+                         dtype={column: str for column in passthrough}, keep_default_na=False)
+    for number, chunk in enumerate(reader):
+        columns = validate_indicators(chunk, first_row=summary.rows)
+        scores, tiers = score_indicators(columns)
+
+        status = None
+        if "Diabetes_012" in chunk.columns:
+            status = pd.to_numeric(chunk["Diabetes_012"], errors="coerce").to_numpy(dtype=float)
+            status = np.where(np.isin(status, (0, 1, 2)), status, -1).astype(np.int8)
+
+        scored = chunk[passthrough].copy()
+        for column, values in columns.items():
+            scored[column] = values
+        scored["Lifestyle_Score"] = scores
+        scored["Risk_Tier"] = pd.Categorical.from_codes(tiers, RISK_TIERS)
+        scored.to_csv(out, header=number == 0, index=False)
+        summary.add(scores, tiers, status)
+
+    if summary.rows == 0:
+        raise CohortValidationError("The uploaded file has no rows")
+    return summary
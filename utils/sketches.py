@@ -0,0 +1,154 @@
+"""
+Mergeable quantile sketches for the continuous BRFSS measures
+
+BMI, MentHlth and PhysHlth are whole numbers on a bounded scale, so each
+sketch is a fixed-grid count vector: exact for these measures, constant in
+size and mergeable by adding counts. A SketchCube keeps one sketch per
+combination of the segment dimensions, built in a single pass at ingestion,
+so medians, IQRs and box plots for any segment come from summing a few cells
+instead of sorting rows.
+"""
+
+from typing import Dict, Iterable, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# measure -> (lowest value, highest value, bin width)
+MEASURES: Dict[str, Tuple[float, float, float]] = {
+    "BMI": (10, 100, 1),
+    "MentHlth": (0, 30, 1),
+    "PhysHlth": (0, 30, 1)
+}
+
+DIMENSIONS = ("Diabetes_012", "Age", "Sex", "HighBP", "HighChol")
+
+
+class QuantileSketch:
+    """Counts of one measure on a fixed value grid"""
+
+    def __init__(self, counts: np.ndarray, low: float, width: float):
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.low = low
+        self.width = width
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], low: float, high: float,
+                    width: float = 1) -> "QuantileSketch":
+        nbins = int(round((high - low) / width)) + 1
+        values = np.asarray(values, dtype=float)
+        bins = _bin_index(values[np.isfinite(values)], low, width, nbins)
+        return cls(np.bincount(bins, minlength=nbins), low, width)
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if (self.low, self.width, len(self.counts)) != (other.low, other.width, len(other.counts)):
+            raise ValueError("Can only merge sketches built on the same grid")
+        return QuantileSketch(self.counts + other.counts, self.low, self.width)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def _value_at(self, rank: np.ndarray) -> np.ndarray:
+        """Value of the sorted observation at each zero-based rank"""
+        index = np.searchsorted(np.cumsum(self.counts), rank, side="right")
+        return self.low + index * self.width
+
+    def quantile(self, q: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+        """Linearly interpolated quantile, matching ``pd.Series.quantile``"""
+        if self.count == 0:
+            raise ValueError("Quantile of an empty sketch")
+        position = (self.count - 1) * np.asarray(q, dtype=float)
+        lower = np.floor(position)
+        below = self._value_at(lower)
+        above = self._value_at(np.ceil(position))
+        values = below + (position - lower) * (above - below)
+        return float(values) if values.ndim == 0 else values
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    def box_stats(self) -> Dict[str, float]:
+        """Quartiles plus Tukey whiskers ending at the most extreme observed values within the fences"""
+        q1, median, q3 = self.quantile([0.25, 0.5, 0.75])
+        observed = self.low + np.flatnonzero(self.counts) * self.width
+        iqr = q3 - q1
+        inside = observed[(observed >= q1 - 1.5 * iqr) & (observed <= q3 + 1.5 * iqr)]
+        return {
+            "min": float(observed[0]),
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "max": float(observed[-1]),
+            "iqr": iqr,
+            "lowerfence": float(inside[0]),
+            "upperfence": float(inside[-1])
+        }
+
+
+def _bin_index(values: np.ndarray, low: float, width: float, nbins: int) -> np.ndarray:
+    """Grid index of each value; callers drop non-finite values first"""
+    return np.clip(np.rint((values - low) / width), 0, nbins - 1).astype(np.intp)
+
+
+class SketchCube:
+    """Quantile sketches for every cell of the segment dimensions
+
+    Rows with a missing dimension are left out of every cell, and missing
+    measure values are skipped and counted in ``missing``, like pandas means.
+    """
+
+    def __init__(self, df: pd.DataFrame, measures: Dict[str, Tuple[float, float, float]] = MEASURES,
+                 dimensions: Tuple[str, ...] = DIMENSIONS):
+        self.dimensions = tuple(dimensions)
+        self.levels = {}
+        df = df[df[list(self.dimensions)].notna().all(axis=1)]
+        cell = np.zeros(len(df), dtype=np.intp)
+        for dimension in self.dimensions:
+            levels, codes = np.unique(df[dimension].to_numpy(), return_inverse=True)
+            self.levels[dimension] = levels
+            cell = cell * len(levels) + codes.ravel()
+        shape = tuple(len(self.levels[d]) for d in self.dimensions)
+        ncells = int(np.prod(shape))
+
+        self.grids = {}
+        self.counts = {}
+        self.missing = {}
+        for measure, (low, high, width) in measures.items():
+            nbins = int(round((high - low) / width)) + 1
+            values = pd.to_numeric(df[measure], errors="coerce").to_numpy(dtype=float)
+            finite = np.isfinite(values)
+            bins = _bin_index(values[finite], low, width, nbins)
+            counts = np.bincount(cell[finite] * nbins + bins, minlength=ncells * nbins)
+            self.grids[measure] = (low, width)
+            self.missing[measure] = int((~finite).sum())
+            self.counts[measure] = counts.reshape(shape + (nbins,))
+
+    def _select(self, measure: str, filters: Dict[str, object]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Counts restricted to the filtered levels, plus the levels kept per dimension"""
+        counts = self.counts[measure]
+        levels = dict(self.levels)
+        for axis, dimension in enumerate(self.dimensions):
+            if dimension not in filters:
+                continue
+            keep = np.isin(levels[dimension], np.atleast_1d(filters[dimension]))
+            counts = counts.compress(keep, axis=axis)
+            levels[dimension] = levels[dimension][keep]
+        return counts, levels
+
+    def sketch(self, measure: str, **filters) -> QuantileSketch:
+        """Merged sketch of all cells matching the filters (value or list per dimension)"""
+        counts, _ = self._select(measure, filters)
+        low, width = self.grids[measure]
+        return QuantileSketch(counts.reshape(-1, counts.shape[-1]).sum(axis=0), low, width)
+
+    def by(self, measure: str, dimension: str, **filters) -> Dict[object, QuantileSketch]:
+        """One merged sketch per level of ``dimension`` within the filtered cells"""
+        counts, levels = self._select(measure, filters)
+        axis = self.dimensions.index(dimension)
+        other_axes = tuple(a for a in range(counts.ndim - 1) if a != axis)
+        per_level = counts.sum(axis=other_axes)
+        low, width = self.grids[measure]
+        return {
+            level.item(): QuantileSketch(row, low, width)
+            for level, row in zip(levels[dimension], per_level)
+        }
@@ -0,0 +1,246 @@
+"""
+Pre-render the storybook chapters to static HTML
+
+Every chapter and every selectbox variant (each character, each risk factor)
+becomes its own page with the Plotly figures embedded as pre-aggregated JSON,
+so read-only viewers can be served from any static file server. Only the
+interactive lifestyle assessment links back to the live Streamlit app.
+
+Usage:
+    python -m utils.static_export --out site --live-url https://example.org/app
+"""
+
+import argparse
+import html
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+from utils import figures, stats
+from utils.sketches import SketchCube
+from utils import story_content as content
+from utils.data import DATA_FILE, read_dataset
+
+PLOTLY_JS = "plotly.min.js"
+
+EXPORT_CSS = """
+body { margin: 0; font-family: 'Source Sans Pro', sans-serif; color: #31333F; }
+.layout { display: flex; min-height: 100vh; }
+.sidebar { width: 16rem; background: #f0f2f6; padding: 2rem 1rem; flex-shrink: 0; }
+.sidebar a { display: block; padding: 0.4rem 0.5rem; color: #31333F; text-decoration: none; border-radius: 5px; }
+.sidebar a.active { background: #2E86AB; color: white; }
+.main { flex: 1; max-width: 70rem; padding: 2rem 3rem; }
+.columns { display: flex; gap: 1.5rem; }
+.columns > div { flex: 1; }
+.variants a { display: inline-block; margin: 0.25rem; padding: 0.3rem 0.8rem; border: 1px solid #2E86AB; border-radius: 20px; color: #2E86AB; text-decoration: none; }
+.variants a.active { background: #2E86AB; color: white; }
+.metric { margin: 0.5rem 0 1rem; }
+.metric-label { font-size: 0.9rem; color: #666; }
+.metric-value { font-size: 2rem; }
+.notice { background: #E8F4F8; padding: 1rem; border-radius: 10px; }
+"""
+
+
+def _slug(label: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+
+
+def _active(selected: bool) -> str:
+    return ' class="active"' if selected else ""
+
+
+def _metric(label: str, value: str) -> str:
+    return (f'<div class="metric"><div class="metric-label">{html.escape(label)}</div>'
+            f'<div class="metric-value">{html.escape(value)}</div></div>')
+
+
+def _columns(*columns: str) -> str:
+    return '<div class="columns">' + "".join(f"<div>{col}</div>" for col in columns) + "</div>"
+
+
+def _variants(label: str, options: Dict[str, str], active: str) -> str:
+    links = "".join(
+        f'<a href="{href}"{_active(option == active)}>{html.escape(option)}</a>'
+        for option, href in options.items()
+    )
+    return f'<p><strong>{html.escape(label)}</strong></p><div class="variants">{links}</div>'
+
+
+class _Page:
+    """Accumulates the HTML blocks of one exported page"""
+
+    def __init__(self, filename: str, chapter: str):
+        self.filename = filename
+        self.chapter = chapter
+        self.blocks: List[str] = []
+        self._figures = 0
+
+    def add(self, block: str) -> None:
+        self.blocks.append(block)
+
+    def figure(self, fig) -> str:
+        """Return a placeholder div plus the script that draws the figure"""
+        self._figures += 1
+        div_id = f"fig-{self._figures}"
+        spec = fig.to_json().replace("</", "<\\/")
+        return (f'<div id="{div_id}"></div><script>'
+                f'(function(){{var f={spec};Plotly.newPlot("{div_id}",f.data,f.layout,'
+                f'{{responsive:true}});}})();</script>')
+
+    def render(self, nav: List[Tuple[str, str]], css: str) -> str:
+        links = "".join(
+            f'<a href="{href}"{_active(chapter == self.chapter)}>'
+            f'{html.escape(chapter)}</a>'
+            for chapter, href in nav
+        )
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Diabetes Health Stories</title>
+<script src="{PLOTLY_JS}"></script>
+<style>{EXPORT_CSS}{css}</style>
+</head>
+<body>
+<div class="layout">
+<nav class="sidebar"><h2>📖 Story Navigation</h2>{links}</nav>
+<main class="main">
+{"".join(self.blocks)}
+<hr>
+{content.FOOTER}
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def _introduction(df: pd.DataFrame) -> List[_Page]:
+    page = _Page("index.html", content.PAGES[0])
+    page.add(content.STORY_HEADER)
+    page.add(content.INTRO_CARD)
+    page.add(_columns(content.DISCOVER_CARD, content.HOW_TO_CARD))
+    page.add("<h3>📈 Quick Overview</h3>")
+    page.add(_columns(*(_metric(k, v) for k, v in stats.quick_stats(df).items())))
+    return [page]
+
+
+def _meet_the_people(df: pd.DataFrame) -> List[_Page]:
+    files = {name: f"people-{_slug(name.split(' - ')[0])}.html" for name in content.CHARACTERS}
+    pages = []
+    for name, card in content.CHARACTERS.items():
+        page = _Page(files[name], content.PAGES[1])
+        page.add(content.PEOPLE_HEADER)
+        page.add(content.PEOPLE_CARD)
+        page.add(_variants("Choose a character to follow:", files, name))
+        page.add(card)
+        if "Maria" in name:
+            fig = figures.similar_profiles_pie(df)
+            if fig is not None:
+                page.add("<h4>📊 People with Similar Profiles</h4>")
+                page.add(page.figure(fig))
+            else:
+                page.add('<p class="notice">No exact matches found. Try different character profiles.</p>')
+        pages.append(page)
+    return pages
+
+
+def _big_picture(df: pd.DataFrame, cube: SketchCube) -> List[_Page]:
+    page = _Page("big-picture.html", content.PAGES[2])
+    page.add(content.BIG_PICTURE_HEADER)
+    page.add(content.BIG_PICTURE_CARD)
+    metrics = "".join(_metric(label, value) for label, value in content.PREVALENCE_METRICS)
+    page.add(_columns(page.figure(figures.prevalence_pie(df)), content.PREVALENCE_INSIGHT + metrics))
+    page.add("<h3>📅 Diabetes Through Life Stages</h3>")
+    page.add(page.figure(figures.age_prevalence_bar(df)))
+    page.add(_columns(page.figure(figures.bmi_box_by_age_group(cube)),
+                      page.figure(figures.health_days_box(cube))))
+    return [page]
+
+
+def _risk_factors(df: pd.DataFrame, cube: SketchCube) -> List[_Page]:
+    files = {factor: f"risk-{_slug(factor)}.html" for factor in content.RISK_FACTORS}
+    pages = []
+    for risk_factor, column in content.RISK_FACTORS.items():
+        page = _Page(files[risk_factor], content.PAGES[3])
+        page.add(content.RISK_HEADER)
+        page.add(content.RISK_CARD)
+        page.add(_variants("Select a risk factor to explore:", files, risk_factor))
+        if column == "BMI":
+            metrics = [_metric(k, v) for k, v in stats.bmi_stats(df).items()]
+            page.add(_columns("".join(metrics[:2]), "".join(metrics[2:])))
+            page.add(page.figure(figures.bmi_histogram(df)))
+            page.add(page.figure(figures.bmi_box_by_status(cube)))
+        else:
+            page.add(page.figure(figures.comorbidity_bar(df, risk_factor, column)))
+        pages.append(page)
+    return pages
+
+
+def _socioeconomic(df: pd.DataFrame) -> List[_Page]:
+    page = _Page("socioeconomic.html", content.PAGES[4])
+    page.add(content.SOCIO_HEADER)
+    page.add(content.SOCIO_CARD)
+    page.add(page.figure(figures.income_bar(df)))
+    page.add(content.INCOME_INSIGHT)
+    page.add(page.figure(figures.education_line(df)))
+    return [page]
+
+
+def _lifestyle(df: pd.DataFrame, live_url: Optional[str]) -> List[_Page]:
+    page = _Page("lifestyle.html", content.PAGES[5])
+    page.add(content.LIFESTYLE_HEADER)
+    page.add(content.LIFESTYLE_CARD)
+    page.add(page.figure(figures.lifestyle_bar(df)))
+    page.add("<h3>🎯 Your Lifestyle Assessment</h3>")
+    if live_url:
+        page.add(f'<p class="notice">The personal assessment runs in the '
+                 f'<a href="{html.escape(live_url)}">live storybook</a>.</p>')
+    else:
+        page.add('<p class="notice">The personal assessment is available in the live storybook.</p>')
+    return [page]
+
+
+def build_site(df: pd.DataFrame, out_dir: Path, live_url: Optional[str] = None) -> List[Path]:
+    """Render every chapter and variant of the storybook into ``out_dir``"""
+    cube = SketchCube(df)
+    chapters = [
+        _introduction(df),
+        _meet_the_people(df),
+        _big_picture(df, cube),
+        _risk_factors(df, cube),
+        _socioeconomic(df),
+        _lifestyle(df, live_url)
+    ]
+    nav = [(pages[0].chapter, pages[0].filename) for pages in chapters]
+    css = content.load_css()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / PLOTLY_JS).write_text(get_plotlyjs(), encoding="utf-8")
+
+    written = []
+    for pages in chapters:
+        for page in pages:
+            path = out_dir / page.filename
+            path.write_text(page.render(nav, css), encoding="utf-8")
+            written.append(path)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data", type=Path, default=DATA_FILE, help="BRFSS CSV to render")
+    parser.add_argument("--out", type=Path, default=Path("site"), help="output directory")
+    parser.add_argument("--live-url", help="URL of the live app for the lifestyle assessment")
+    args = parser.parse_args(argv)
+
+    written = build_site(read_dataset(args.data), args.out, args.live_url)
+    print(f"Wrote {len(written)} pages to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
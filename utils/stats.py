@@ -0,0 +1,32 @@
+"""
+Headline statistics for the diabetes dashboard
+
+Kept free of plotting imports so metric-only views render without loading the
+figure builders.
+"""
+
+from typing import Dict
+import pandas as pd
+
+
+def quick_stats(df: pd.DataFrame) -> Dict[str, str]:
+    """Headline metrics for the Introduction page"""
+    diabetes_rate = (df['Diabetes_012'] == 2).mean() * 100
+    avg_age_group = df['Age'].median()
+    return {
+        "Total Stories": f"{len(df):,}",
+        "Diabetes Rate": f"{diabetes_rate:.1f}%",
+        "Median Age Group": "45-54" if avg_age_group > 8 else "35-44"
+    }
+
+
+def bmi_stats(df: pd.DataFrame) -> Dict[str, str]:
+    """Average BMI and obesity rate with and without diabetes"""
+    diabetic = df[df['Diabetes_012'] == 2]['BMI']
+    healthy = df[df['Diabetes_012'] == 0]['BMI']
+    return {
+        "Avg BMI with Diabetes": f"{diabetic.mean():.1f}",
+        "Avg BMI without Diabetes": f"{healthy.mean():.1f}",
+        "Obesity Rate (Diabetes)": f"{(diabetic >= 30).mean() * 100:.1f}%",
+        "Obesity Rate (Healthy)": f"{(healthy >= 30).mean() * 100:.1f}%"
+    }
@@ -0,0 +1,195 @@
+"""
+Narrative content shared by the live dashboard and the static storybook export
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assests"
+STYLE_SHEETS = ("app_styles.css", "story_styles.css")
+
+PAGES = [
+    "📚 Introduction", "👥 Meet the People", "📈 The Big Picture",
+    "🔍 Risk Factors", "💰 Socioeconomic Stories", "🏃 Lifestyle Choices"
+]
+
+DIABETES_STORIES = {
+    0: 'Living without diabetes',
+    1: 'At the crossroads: Prediabetes',
+    2: 'Managing diabetes daily'
+}
+
+STORY_COLORS = ['#2E86AB', '#F18F01', '#A23B72']
+
+RISK_FACTORS = {
+    "High Blood Pressure": "HighBP",
+    "High Cholesterol": "HighChol",
+    "Obesity (BMI ≥ 30)": "BMI",
+    "Heart Disease": "HeartDiseaseorAttack",
+    "Smoking": "Smoker"
+}
+
+
+@lru_cache(maxsize=None)
+def load_css(names: Tuple[str, ...] = STYLE_SHEETS) -> str:
+    """Concatenate the storybook style sheets from the assets folder (read once per process)"""
+    return "\n".join((ASSETS_DIR / name).read_text(encoding="utf-8") for name in names)
+
+
+STORY_HEADER = '<h1 class="story-header">The Diabetes Chronicles</h1>'
+
+INTRO_CARD = """
+<div class="story-card">
+    <h3>Welcome to the Data Storybook</h3>
+    <p>This interactive dashboard tells the stories behind 70,000+ health records
+    from the 2015 BRFSS survey. Each data point represents a person's health journey.</p>
+    <div class="insight-box">
+        <strong>Our Mission:</strong> To transform health statistics into
+        meaningful narratives that can inform, educate, and inspire change.
+    </div>
+</div>
+"""
+
+DISCOVER_CARD = """
+<div class="story-card">
+    <h3>📊 What You'll Discover</h3>
+    <ul>
+        <li>Real health stories behind the numbers</li>
+        <li>How risk factors interact in people's lives</li>
+        <li>The socioeconomic dimensions of health</li>
+        <li>Lifestyle choices that make a difference</li>
+        <li>Your own health narrative</li>
+    </ul>
+</div>
+"""
+
+HOW_TO_CARD = """
+<div class="story-card">
+    <h3>🎯 How to Use This Storybook</h3>
+    <ol>
+        <li>Navigate chapters using the sidebar</li>
+        <li>Interact with visualizations</li>
+        <li>Follow character stories</li>
+        <li>Apply insights to your own journey</li>
+        <li>Share your discoveries</li>
+    </ol>
+</div>
+"""
+
+PEOPLE_HEADER = '<h1 class="chapter-header">Chapter 1: Faces Behind the Numbers</h1>'
+
+PEOPLE_CARD = """
+<div class="story-card">
+    <h3>The Human Stories</h3>
+    <p>Every row in our dataset is a person with a unique health journey.
+    Let's meet some representative stories from the data.</p>
+</div>
+"""
+
+CHARACTERS: Dict[str, str] = {
+    "Maria - Single mother, 42": """
+<div class="character-card">
+    <h4>👩 Maria, 42</h4>
+    <p><em>Single mother working two jobs, recently diagnosed with prediabetes</em></p>
+    <hr>
+    <p><strong>Her Story:</strong> Between her office job and evening shifts at the restaurant,
+    Maria finds little time for exercise. Affordable healthy food is hard to find in her
+    neighborhood, and her family history of diabetes keeps her worried.</p>
+    <p><strong>Key Stats:</strong> BMI 31, High BP, Income level 3/8</p>
+</div>
+""",
+    "James - Retired teacher, 58": """
+<div class="character-card">
+    <h4>👨 James, 58</h4>
+    <p><em>Retired teacher, managing type 2 diabetes</em></p>
+    <hr>
+    <p><strong>His Story:</strong> James loves cooking traditional family recipes,
+    but they're high in carbs. Since his diagnosis 5 years ago, he's been learning
+    to adapt his favorite dishes while managing medication and regular check-ups.</p>
+    <p><strong>Key Stats:</strong> BMI 28, High Cholesterol, College educated</p>
+</div>
+""",
+    "Sophia - Software engineer, 29": """
+<div class="character-card">
+    <h4>👩💻 Sophia, 29</h4>
+    <p><em>Software engineer, health-conscious lifestyle</em></p>
+    <hr>
+    <p><strong>Her Story:</strong> Sophia prioritizes health with regular gym sessions
+    and meal prep. Despite her healthy habits, her family history of diabetes keeps
+    her vigilant about regular check-ups and maintaining a balanced lifestyle.</p>
+    <p><strong>Key Stats:</strong> BMI 23, Physically Active, High Income</p>
+</div>
+"""
+}
+
+BIG_PICTURE_HEADER = '<h1 class="chapter-header">Chapter 2: The National Health Landscape</h1>'
+
+BIG_PICTURE_CARD = """
+<div class="story-card">
+    <h3>The Prevalence Story</h3>
+    <p>Understanding diabetes at a population level helps us see patterns
+    and identify opportunities for intervention.</p>
+</div>
+"""
+
+PREVALENCE_INSIGHT = """
+<div class="insight-box">
+    <h4>📖 The Narrative</h4>
+    <p>That <strong>5% in prediabetes</strong> represents our greatest
+    opportunity. These are people at a crossroads where lifestyle
+    interventions can change their health trajectory.</p>
+</div>
+"""
+
+PREVALENCE_METRICS = [
+    ("Diabetes Rate", "7.0%"),
+    ("Prediabetes Rate", "5.0%"),
+    ("Healthy Population", "88.0%")
+]
+
+RISK_HEADER = '<h1 class="chapter-header">Chapter 3: Uncovering Risk Factors</h1>'
+
+RISK_CARD = """
+<div class="story-card">
+    <h3>The Investigation</h3>
+    <p>Diabetes rarely travels alone. Let's investigate which factors
+    commonly accompany it in people's health stories.</p>
+</div>
+"""
+
+SOCIO_HEADER = '<h1 class="chapter-header">Chapter 4: The Economics of Health</h1>'
+
+SOCIO_CARD = """
+<div class="story-card">
+    <h3>Health and Wealth</h3>
+    <p>Health outcomes are deeply connected to socioeconomic factors.
+    Let's explore how income and education shape health stories.</p>
+</div>
+"""
+
+INCOME_INSIGHT = """
+<div class="insight-box">
+    <strong>The Income Story:</strong> People with lower incomes face
+    higher diabetes rates. This isn't just about individual choices—it's
+    about access to healthy food, safe places to exercise, quality healthcare,
+    and reduced stress.
+</div>
+"""
+
+LIFESTYLE_HEADER = '<h1 class="chapter-header">Chapter 5: Daily Choices, Lasting Impact</h1>'
+
+LIFESTYLE_CARD = """
+<div class="story-card">
+    <h3>The Power of Habits</h3>
+    <p>Small daily choices accumulate into significant health outcomes.
+    Let's explore how lifestyle factors influence diabetes risk.</p>
+</div>
+"""
+
+FOOTER = """
+<div style='text-align: center; color: #666;'>
+    <p>📖 The Diabetes Chronicles | BRFSS 2015 Data | Made with ❤️ using Streamlit</p>
+    <p>⚠️ Educational tool only. Consult healthcare professionals for medical advice.</p>
+</div>
+"""
@@ -1,207 +1,254 @@
-"""
-Story generator utilities for the diabetes dashboard
-"""
-
-import random
-from typing import Dict, List
-import pandas as pd
-
-class DiabetesStoryGenerator:
-    """Generate human-readable stories from diabetes data"""
-    
-    def __init__(self, df: pd.DataFrame):
-        self.df = df
-        
-    def generate_persona_story(self, row: pd.Series) -> str:
-        """Generate a story for an individual data point"""
-        
-        age_story = {
-            (0, 3): "a young adult starting their journey",
-            (4, 6): "in the prime working years",
-            (7, 9): "navigating midlife challenges",
-            (10, 13): "in the wisdom years of life"
-        }
-        
-        bmi_story = {
-            (0, 18.5): "maintaining a lean physique",
-            (18.5, 25): "keeping a healthy weight",
-            (25, 30): "carrying some extra weight",
-            (30, 100): "facing weight management challenges"
-        }
-        
-        # Find age category
-        age_category = next(
-            (desc for (low, high), desc in age_story.items() 
-             if low <= row['Age'] <= high),
-            "at an unspecified age"
-        )
-        
-        # Find BMI category
-        bmi_category = next(
-            (desc for (low, high), desc in bmi_story.items() 
-             if low <= row['BMI'] <= high),
-            "with an unspecified weight"
-        )
-        
-        # Diabetes status
-        diabetes_map = {
-            0: "managing to stay diabetes-free",
-            1: "navigating the prediabetes warning zone",
-            2: "living with diabetes"
-        }
-        
-        diabetes_story = diabetes_map.get(row['Diabetes_012'], "with unspecified diabetes status")
-        
-        # Build the story
-        story_templates = [
-            f"This person is {age_category}, {bmi_category}, and {diabetes_story}.",
-            f"At this life stage, they're {age_category} and {diabetes_story}, while {bmi_category}.",
-            f"{diabetes_story.capitalize()} while {age_category} and {bmi_category}."
-        ]
-        
-        return random.choice(story_templates)
-    
-    def generate_insight_story(self, insight_type: str, data: Dict) -> str:
-        """Generate narrative insights from data patterns"""
-        
-        insight_templates = {
-            "age_trend": [
-                "As people move through life chapters, diabetes risk evolves. {age_group} see "
-                "{change} in diabetes rates compared to younger groups.",
-                
-                "The story of diabetes changes with age. {age_group} experience "
-                "{change}, telling us about cumulative lifestyle effects."
-            ],
-            
-            "income_effect": [
-                "Health stories are written with different resources. Those with {income_level} "
-                "face {comparison} diabetes rates, highlighting healthcare access narratives.",
-                
-                "Economic circumstances shape health journeys. {income_level} individuals "
-                "have {comparison} diabetes prevalence, revealing opportunity gaps."
-            ],
-            
-            "lifestyle_impact": [
-                "Daily choices write health futures. People who {habit} show "
-                "{effect} in diabetes rates compared to those who don't.",
-                
-                "Small habits create big health stories. {habit} is associated with "
-                "{effect}, demonstrating lifestyle's narrative power."
-            ]
-        }
-        
-        template = random.choice(insight_templates.get(insight_type, ["{data}"]))
-        return template.format(**data)
-    
-    def create_data_point_character(self, index: int) -> Dict:
-        """Create a character profile from a data point"""
-        if index >= len(self.df):
-            index = random.randint(0, len(self.df)-1)
-        
-        row = self.df.iloc[index]
-        
-        # Generate a name
-        names = ["Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Drew"]
-        
-        # Create character profile
-        character = {
-            "name": random.choice(names),
-            "age_group": self._get_age_group(row['Age']),
-            "bmi_category": self._get_bmi_category(row['BMI']),
-            "diabetes_status": self._get_diabetes_status(row['Diabetes_012']),
-            "challenges": self._identify_challenges(row),
-            "strengths": self._identify_strengths(row),
-            "story": self.generate_persona_story(row)
-        }
-        
-        return character
-    
-    def _get_age_group(self, age: int) -> str:
-        groups = {
-            (0, 3): "Young Adult (18-24)",
-            (4, 6): "Established Adult (25-44)",
-            (7, 9): "Midlife (45-64)",
-            (10, 13): "Senior (65+)"
-        }
-        return next((name for (low, high), name in groups.items() if low <= age <= high), "Unknown")
-    
-    def _get_bmi_category(self, bmi: float) -> str:
-        if bmi < 18.5:
-            return "Underweight"
-        elif bmi < 25:
-            return "Normal"
-        elif bmi < 30:
-            return "Overweight"
-        else:
-            return "Obese"
-    
-    def _get_diabetes_status(self, status: int) -> str:
-        return ["No Diabetes", "Prediabetes", "Diabetes"][int(status)]
-    
-    def _identify_challenges(self, row: pd.Series) -> List[str]:
-        challenges = []
-        
-        if row['HighBP'] == 1:
-            challenges.append("High blood pressure")
-        if row['HighChol'] == 1:
-            challenges.append("High cholesterol")
-        if row['Smoker'] == 1:
-            challenges.append("Smoking habit")
-        if row['PhysActivity'] == 0:
-            challenges.append("Sedentary lifestyle")
-        if row['NoDocbcCost'] == 1:
-            challenges.append("Healthcare access due to cost")
-        
-        return challenges or ["Managing general health"]
-    
-    def _identify_strengths(self, row: pd.Series) -> List[str]:
-        strengths = []
-        
-        if row['PhysActivity'] == 1:
-            strengths.append("Physically active")
-        if row['Fruits'] == 1 or row['Veggies'] == 1:
-            strengths.append("Healthy eating habits")
-        if row['AnyHealthcare'] == 1:
-            strengths.append("Access to healthcare")
-        if row['Education'] >= 5:
-            strengths.append("Higher education")
-        
-        return strengths or ["Resilience in health journey"]
-
-
-# Example usage in your Streamlit app
-def add_storytelling_elements():
-    """Add storytelling elements to your dashboard"""
-    
-    # Initialize story generator
-    story_gen = DiabetesStoryGenerator(df)
-    
-    # Generate a random character story
-    character = story_gen.create_data_point_character(42)
-    
-    # Display the character story
-    st.markdown(f"""
-    <div class="character-spotlight">
-        <h3>👤 Meet {character['name']}</h3>
-        <p><strong>Age:</strong> {character['age_group']}</p>
-        <p><strong>Health Status:</strong> {character['diabetes_status']}</p>
-        <p><strong>Challenges:</strong> {', '.join(character['challenges'])}</p>
-        <p><strong>Strengths:</strong> {', '.join(character['strengths'])}</p>
-        <hr>
-        <p><em>{character['story']}</em></p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Generate insight story
-    insight_data = {
-        "age_group": "adults over 45",
-        "change": "a significant increase"
-    }
-    
-    insight_story = story_gen.generate_insight_story("age_trend", insight_data)
-    
-    st.markdown(f"""
-    <div class="story-quote">
-        {insight_story}
-    </div>
+"""
+Story generator utilities for the diabetes dashboard
+"""
+
+import random
+from typing import Dict, List, Mapping, Tuple
+import numpy as np
+
+# Band labels are interned once per process; the generator only stores int8
+# codes into these tables. Where a value can fall outside every band, the
+# last entry is the fallback.
+AGE_EDGES = np.array([3, 6, 9, 13])
+AGE_STORIES = (
+    "a young adult starting their journey",
+    "in the prime working years",
+    "navigating midlife challenges",
+    "in the wisdom years of life",
+    "at an unspecified age"
+)
+AGE_GROUPS = (
+    "Young Adult (18-24)",
+    "Established Adult (25-44)",
+    "Midlife (45-64)",
+    "Senior (65+)",
+    "Unknown"
+)
+
+BMI_STORY_EDGES = np.array([18.5, 25, 30, 100])
+BMI_STORIES = (
+    "maintaining a lean physique",
+    "keeping a healthy weight",
+    "carrying some extra weight",
+    "facing weight management challenges",
+    "with an unspecified weight"
+)
+BMI_CATEGORY_EDGES = np.array([18.5, 25, 30])
+BMI_CATEGORIES = ("Underweight", "Normal", "Overweight", "Obese")
+
+DIABETES_STORIES = (
+    "managing to stay diabetes-free",
+    "navigating the prediabetes warning zone",
+    "living with diabetes",
+    "with unspecified diabetes status"
+)
+DIABETES_STATUSES = ("No Diabetes", "Prediabetes", "Diabetes", "Unknown")
+
+NAMES = ("Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Drew")
+
+CHALLENGES = (
+    "High blood pressure",
+    "High cholesterol",
+    "Smoking habit",
+    "Sedentary lifestyle",
+    "Healthcare access due to cost"
+)
+STRENGTHS = (
+    "Physically active",
+    "Healthy eating habits",
+    "Access to healthcare",
+    "Higher education"
+)
+
+TRAIT_COLUMNS = (
+    "HighBP", "HighChol", "Smoker", "PhysActivity", "NoDocbcCost",
+    "Fruits", "Veggies", "AnyHealthcare", "Education"
+)
+
+INSIGHT_TEMPLATES = {
+    "age_trend": (
+        "As people move through life chapters, diabetes risk evolves. {age_group} see "
+        "{change} in diabetes rates compared to younger groups.",
+        
+        "The story of diabetes changes with age. {age_group} experience "
+        "{change}, telling us about cumulative lifestyle effects."
+    ),
+    
+    "income_effect": (
+        "Health stories are written with different resources. Those with {income_level} "
+        "face {comparison} diabetes rates, highlighting healthcare access narratives.",
+        
+        "Economic circumstances shape health journeys. {income_level} individuals "
+        "have {comparison} diabetes prevalence, revealing opportunity gaps."
+    ),
+    
+    "lifestyle_impact": (
+        "Daily choices write health futures. People who {habit} show "
+        "{effect} in diabetes rates compared to those who don't.",
+        
+        "Small habits create big health stories. {habit} is associated with "
+        "{effect}, demonstrating lifestyle's narrative power."
+    )
+}
+
+
+def _label_sets(labels: Tuple[str, ...], default: str) -> Tuple[Tuple[str, ...], ...]:
+    """Label list for every bitmask over ``labels``"""
+    return tuple(
+        tuple(label for bit, label in enumerate(labels) if mask >> bit & 1) or (default,)
+        for mask in range(1 << len(labels))
+    )
+
+
+CHALLENGE_SETS = _label_sets(CHALLENGES, "Managing general health")
+STRENGTH_SETS = _label_sets(STRENGTHS, "Resilience in health journey")
+
+# Every persona story variant, indexed by [age code][BMI story code][diabetes code]
+PERSONA_STORIES = tuple(
+    tuple(
+        tuple(
+            (
+                f"This person is {age}, {bmi}, and {diabetes}.",
+                f"At this life stage, they're {age} and {diabetes}, while {bmi}.",
+                f"{diabetes.capitalize()} while {age} and {bmi}."
+            )
+            for diabetes in DIABETES_STORIES
+        )
+        for bmi in BMI_STORIES
+    )
+    for age in AGE_STORIES
+)
+
+
+def encode_bands(age, bmi, status) -> Dict[str, np.ndarray]:
+    """int8 codes into the age, BMI and diabetes tables"""
+    age = np.atleast_1d(np.asarray(age, dtype=float))
+    bmi = np.atleast_1d(np.asarray(bmi, dtype=float))
+    status = np.atleast_1d(np.asarray(status, dtype=float))
+
+    age_code = np.searchsorted(AGE_EDGES, age, side="left")
+    age_code[age < 0] = len(AGE_EDGES)
+    bmi_story = np.searchsorted(BMI_STORY_EDGES, bmi, side="left")
+    bmi_story[bmi < 0] = len(BMI_STORY_EDGES)
+
+    return {
+        "age": age_code.astype(np.int8),
+        "bmi_story": bmi_story.astype(np.int8),
+        "bmi_category": np.searchsorted(BMI_CATEGORY_EDGES, bmi, side="right").astype(np.int8),
+        "diabetes": np.where(np.isin(status, (0, 1, 2)), status, 3).astype(np.int8)
+    }
+
+
+def encode_traits(columns: Mapping) -> Dict[str, np.ndarray]:
+    """Challenge and strength bitmasks, one bit per entry of CHALLENGES / STRENGTHS"""
+    def flag(name: str, value: int = 1) -> np.ndarray:
+        return (np.atleast_1d(np.asarray(columns[name], dtype=float)) == value).astype(np.int8)
+
+    educated = (np.atleast_1d(np.asarray(columns["Education"], dtype=float)) >= 5).astype(np.int8)
+    challenges = (flag("HighBP") | flag("HighChol") << 1 | flag("Smoker") << 2 |
+                  flag("PhysActivity", 0) << 3 | flag("NoDocbcCost") << 4)
+    strengths = (flag("PhysActivity") | (flag("Fruits") | flag("Veggies")) << 1 |
+                 flag("AnyHealthcare") << 2 | educated << 3)
+    return {"challenges": challenges, "strengths": strengths}
+
+
+class DiabetesStoryGenerator:
+    """Generate human-readable stories from diabetes data
+
+    Only int8 codes for the story columns are kept, so the generator does
+    not hold on to the DataFrame and is cheap to share or pickle.
+    """
+
+    def __init__(self, df: Mapping[str, np.ndarray]):
+        self.codes = encode_bands(df['Age'], df['BMI'], df['Diabetes_012'])
+        self.codes.update(encode_traits({name: df[name] for name in TRAIT_COLUMNS}))
+        self.size = len(self.codes["age"])
+
+    def generate_persona_story(self, row: Mapping) -> str:
+        """Generate a story for an individual data point"""
+        codes = encode_bands(row['Age'], row['BMI'], row['Diabetes_012'])
+        return self._persona_story(codes["age"][0], codes["bmi_story"][0], codes["diabetes"][0])
+
+    def _persona_story(self, age: int, bmi: int, diabetes: int) -> str:
+        return random.choice(PERSONA_STORIES[age][bmi][diabetes])
+
+    def generate_insight_story(self, insight_type: str, data: Dict) -> str:
+        """Generate narrative insights from data patterns"""
+        template = random.choice(INSIGHT_TEMPLATES.get(insight_type, ("{data}",)))
+        return template.format(**data)
+    
+    def create_data_point_character(self, index: int) -> Dict:
+        """Create a character profile from a data point"""
+        if index >= self.size:
+            index = random.randint(0, self.size-1)
+        
+        age, bmi_story, bmi_category, diabetes, challenges, strengths = (
+            int(self.codes[name][index])
+            for name in ("age", "bmi_story", "bmi_category", "diabetes", "challenges", "strengths")
+        )
+        
+        # Create character profile
+        character = {
+            "name": random.choice(NAMES),
+            "age_group": AGE_GROUPS[age],
+            "bmi_category": BMI_CATEGORIES[bmi_category],
+            "diabetes_status": DIABETES_STATUSES[diabetes],
+            "challenges": list(CHALLENGE_SETS[challenges]),
+            "strengths": list(STRENGTH_SETS[strengths]),
+            "story": self._persona_story(age, bmi_story, diabetes)
+        }
+        
+        return character
+    
+    def _get_age_group(self, age: int) -> str:
+        return AGE_GROUPS[encode_bands(age, 0, 0)["age"][0]]
+    
+    def _get_bmi_category(self, bmi: float) -> str:
+        return BMI_CATEGORIES[encode_bands(0, bmi, 0)["bmi_category"][0]]
+    
+    def _get_diabetes_status(self, status: int) -> str:
+        return DIABETES_STATUSES[encode_bands(0, 0, status)["diabetes"][0]]
+    
+    def _identify_challenges(self, row: Mapping) -> List[str]:
+        return list(CHALLENGE_SETS[encode_traits(row)["challenges"][0]])
+    
+    def _identify_strengths(self, row: Mapping) -> List[str]:
+        return list(STRENGTH_SETS[encode_traits(row)["strengths"][0]])
+
+
+# Example usage in your Streamlit app
+def add_storytelling_elements():
+    """Add storytelling elements to your dashboard"""
+    
+    # Initialize story generator
+    story_gen = DiabetesStoryGenerator(df)
+    
+    # Generate a random character story
+    character = story_gen.create_data_point_character(42)
+    
+    # Display the character story
+    st.markdown(f"""
+    <div class="character-spotlight">
+        <h3>👤 Meet {character['name']}</h3>
+        <p><strong>Age:</strong> {character['age_group']}</p>
+        <p><strong>Health Status:</strong> {character['diabetes_status']}</p>
+        <p><strong>Challenges:</strong> {', '.join(character['challenges'])}</p>
+        <p><strong>Strengths:</strong> {', '.join(character['strengths'])}</p>
+        <hr>
+        <p><em>{character['story']}</em></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Generate insight story
+    insight_data = {
+        "age_group": "adults over 45",
+        "change": "a significant increase"
+    }
+    
+    insight_story = story_gen.generate_insight_story("age_trend", insight_data)
+    
+    st.markdown(f"""
+    <div class="story-quote">
+        {insight_story}
+    </div>
     """, unsafe_allow_html=True)
\ No newline at end of file